@@ -0,0 +1,30 @@
+import zipfile
+
+import pytest
+
+pytest.importorskip("ebooklib")
+pytest.importorskip("chardet")
+
+import txt_to_epub
+
+
+def test_smart_mode_blank_line_after_sample(tmp_path):
+    # 空行出现在智能识别的抽样范围之后，按标点分段时不应出错
+    lines = ["第1章 开始"] + ["这是一句话。"] * 250 + ["", "最后一句话。"]
+    txt_path = tmp_path / "book.txt"
+    txt_path.write_text("\n".join(lines), encoding="utf-8")
+
+    epub_path = txt_to_epub.txt_to_epub(
+        str(txt_path), str(tmp_path / "book.epub"), paragraph_mode="smart"
+    )
+
+    with zipfile.ZipFile(epub_path) as zf:
+        chapter_xhtml = zf.read("EPUB/chapter_1.xhtml").decode("utf-8")
+    assert "<p>　　最后一句话。</p>" in chapter_xhtml
+
+
+def test_punctuation_mode_skips_blank_lines():
+    lines = ["第一句。", "", "第二句", "接着。"]
+    paragraphs = txt_to_epub._process_punctuation_mode(lines, [False] * len(lines))
+
+    assert "".join(paragraphs) == "<p>第一句。</p>\n<p>第二句接着。</p>\n"
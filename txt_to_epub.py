@@ -2,11 +2,265 @@
 # -*- coding: utf-8 -*-
 
 import os
-import sys
+import codecs
+import html
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from ebooklib import epub
+import chardet
 import re
-import imghdr
+import zipfile
+
+# 读取TXT文件时使用的缓冲区大小（顺序扫描大文件时减少系统调用次数）
+_READ_BUFFER_SIZE = 128 * 1024
+
+# 默认章节识别规则，在模块加载时编译一次
+_DEFAULT_CHAPTER_PATTERN = r"^第.+章.*$"
+_DEFAULT_CHAPTER_RE = re.compile(_DEFAULT_CHAPTER_PATTERN)
+
+# 写入EPUB文件时使用的缓冲区大小（合并各章节的小块写入，减少系统调用次数）
+_WRITE_BUFFER_SIZE = 256 * 1024
+
+# EPUB压缩级别：纯文本在级别1与默认级别下的压缩率相近，但写入速度快得多
+_ZIP_COMPRESS_LEVEL = 1
+
+# 可能表示段落结束的行尾字符
+_PARA_END = frozenset("。！？.!?\"'」》)）")
+
+# 章节XHTML模板，每个章节只需代入语言、标题和正文
+_CHAPTER_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="{lang}" xml:lang="{lang}">
+<head>
+  <title>{title}</title>
+  <link rel="stylesheet" href="style/default.css" type="text/css"/>
+</head>
+<body>
+  <h2>{title}</h2>
+{content}</body>
+</html>
+""".format
+
+# 常见的字节顺序标记（BOM）及对应编码，UTF-32 必须在 UTF-16 之前检查
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _detect_encoding(path, sample_size=64 * 1024):
+    """读取文件开头的样本，检测TXT文件的编码"""
+    with open(path, "rb") as f:
+        sample = f.read(sample_size)
+
+        # 优先根据BOM判断
+        for bom, encoding in _BOMS:
+            if sample.startswith(bom):
+                return encoding
+
+        # 纯ASCII的样本无法区分编码，继续读取，直到遇到含非ASCII字节的样本块
+        while sample.isascii():
+            sample = f.read(sample_size)
+            if not sample:
+                # 整个文件都是ASCII
+                return "utf-8"
+
+    # 样本能按UTF-8解码则直接使用UTF-8（允许样本末尾截断半个字符）
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    encoding = chardet.detect(sample)["encoding"]
+    if not encoding:
+        return "utf-8"
+    # chardet 可能返回 Python 没有对应解码器的编码（如 EUC-TW）
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return "utf-8"
+    # GB2312/GBK 统一按其超集 GB18030 读取，避免生僻字解码失败
+    if encoding.lower() in ("gb2312", "gbk"):
+        return "gb18030"
+    return encoding
+
+
+def _sniff_image_type(head):
+    """根据文件头的魔数判断图片格式，返回 "jpeg"、"png"、"gif" 或 None"""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    return None
+
+
+def _has_indent(line):
+    """检查行是否以全角空格、制表符或至少两个空格开头（表示有缩进）"""
+    # 切片对空行同样安全，每个判断都是一次C层面的字符串操作
+    return line[:1] in ("　", "\t") or line[:2] == "  "
+
+
+def _paragraph_open(add_indent):
+    """返回段落开头的HTML片段，启用时在段首添加全角空格缩进"""
+    return "<p>　　" if add_indent else "<p>"
+
+
+def _process_line_mode(lines, indents, add_indent=False):
+    """每行作为一个段落，返回可直接拼接的HTML片段列表"""
+    para_open = _paragraph_open(add_indent)
+
+    # 各行互不影响，用一个列表推导包装所有非空行（行已去掉原始缩进）
+    return [f"{para_open}{line}</p>\n" for line in lines if line]
+
+
+def _process_blank_mode(lines, indents, add_indent=False):
+    """空行分隔段落，行首缩进同样视为新段落开始"""
+    paragraphs = []
+    append = paragraphs.append  # 循环中直接调用绑定方法，省去属性查找
+    para_open = _paragraph_open(add_indent)
+
+    # 段落内容直接写入 paragraphs，不再为每个段落分配临时列表
+    in_para = False
+    for line, indented in zip(lines, indents):
+        # 如果是空行，则结束当前段落
+        if not line:
+            if in_para:
+                append("</p>\n")
+                in_para = False
+            continue
+
+        # 检查是否有缩进（新段落的标志）
+        if indented and in_para:
+            # 结束前一个段落
+            append("</p>\n")
+            in_para = False
+
+        if not in_para:
+            append(para_open)
+            in_para = True
+        append(line)
+
+    # 处理最后一个段落
+    if in_para:
+        append("</p>\n")
+
+    return paragraphs
+
+
+def _process_punctuation_mode(lines, indents, add_indent=False):
+    """没有明显段落标记时，根据行尾标点符号判断段落"""
+    paragraphs = []
+    append = paragraphs.append
+    para_open = _paragraph_open(add_indent)
+
+    in_para = False
+    for line in lines:
+        # 段落格式只按全书开头抽样判断，抽样范围之后仍可能出现空行，直接跳过
+        if not line:
+            continue
+
+        if not in_para:
+            append(para_open)
+            in_para = True
+        append(line)
+
+        # 行尾是句末标点时，认为段落结束
+        if line[-1] in _PARA_END:
+            append("</p>\n")
+            in_para = False
+
+    # 处理最后一个段落
+    if in_para:
+        append("</p>\n")
+
+    return paragraphs
+
+
+class _XhtmlChapter(epub.EpubHtml):
+    """内容为完整XHTML文档的章节，写入时跳过ebooklib的lxml解析和重新序列化"""
+
+    def get_content(self, default=None):
+        return self.content
+
+
+class _EpubWriter(epub.EpubWriter):
+    """使用较低压缩级别和较大写缓冲区写入EPUB的写入器"""
+
+    def write(self):
+        # ZipFile 不会关闭传入的文件对象，由 with 语句负责刷新并关闭
+        with open(self.file_name, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            self.out = zipfile.ZipFile(
+                f,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                compresslevel=_ZIP_COMPRESS_LEVEL,
+            )
+            # EPUB规范要求mimetype不压缩
+            self.out.writestr(
+                "mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED
+            )
+            self._write_container()
+            self._write_opf()
+            self._write_items()
+            self.out.close()
+
+
+def _write_epub(epub_path, book):
+    """与 epub.write_epub 相同，但使用 _EpubWriter 写入"""
+    writer = _EpubWriter(epub_path, book)
+    writer.process()
+    try:
+        writer.write()
+    except IOError:
+        pass
+
+
+def _detect_smart_processor(raw_chapters, sample_size=200):
+    """智能识别：只预读全书开头的章节，返回 (段落处理函数, 完整的章节迭代器)"""
+    # 有缩进或空行时按缩进和空行分段（与blank模式规则相同），否则按标点符号分段
+    raw_chapters = iter(raw_chapters)
+    buffered = []
+    processor = None
+    has_blank_lines = False
+    sampled = 0
+    for chapter in raw_chapters:
+        buffered.append(chapter)
+        _, lines, indents = chapter
+        for line, indented in zip(lines, indents):
+            if not line:
+                has_blank_lines = True
+            elif indented:
+                processor = _process_blank_mode
+                break
+            else:
+                sampled += 1
+                if sampled >= sample_size:
+                    break
+        # 已看到缩进或抽样足够的非空行，停止预读
+        if processor is not None or sampled >= sample_size:
+            break
+
+    if processor is None:
+        if has_blank_lines:
+            processor = _process_blank_mode
+        else:
+            processor = _process_punctuation_mode
+    # 预读的章节放回迭代器开头，其余章节继续流式读取
+    return processor, chain(buffered, raw_chapters)
+
+
+# 段落识别模式与处理函数的对应关系，smart模式在读取文件后确定
+_PARAGRAPH_PROCESSORS = {
+    "line": _process_line_mode,
+    "blank": _process_blank_mode,
+}
 
 
 def txt_to_epub(
@@ -15,10 +269,11 @@ def txt_to_epub(
     title=None,
     author="净无痕",
     language="zh-CN",
-    chapter_pattern=r"^第.+章.*$",
+    chapter_pattern=_DEFAULT_CHAPTER_PATTERN,
     cover_image=None,
     paragraph_mode="smart",
     force_indent=True,
+    max_workers=1,
 ):
     """
     将TXT文件转换为EPUB格式
@@ -33,8 +288,12 @@ def txt_to_epub(
         cover_image (str, 可选): 封面图片路径，默认为None
         paragraph_mode (str, 可选): 段落识别模式，可选值为"line"(每行一个段落)、"blank"(空行分隔段落)、"smart"(智能识别)
         force_indent (bool, 可选): 是否在HTML层面强制添加段落缩进，默认为True
+        max_workers (int, 可选): 并行处理章节的进程数，默认为1（不使用多进程）
     """
 
+    if max_workers < 1:
+        raise ValueError(f"max_workers 必须为正整数: {max_workers}")
+
     # 如果未提供epub_path，则使用与txt文件同名的.epub文件路径
     if epub_path is None:
         epub_path = os.path.splitext(txt_path)[0] + ".epub"
@@ -55,17 +314,13 @@ def txt_to_epub(
     # 添加封面图片（如果提供）
     if cover_image and os.path.isfile(cover_image):
         try:
-            # 检查是否为有效的图片文件
-            img_type = imghdr.what(cover_image)
-            if img_type in ["jpeg", "png", "gif"]:
-                # 读取封面图片
-                with open(cover_image, "rb") as img_file:
-                    cover_content = img_file.read()
-
+            # 读取封面图片，并根据文件头检查是否为有效的图片文件
+            with open(cover_image, "rb") as img_file:
+                cover_content = img_file.read()
+            img_type = _sniff_image_type(cover_content[:12])
+            if img_type is not None:
                 # 确定MIME类型
                 mime_type = f"image/{img_type}"
-                if img_type == "jpg" or img_type == "jpeg":
-                    mime_type = "image/jpeg"
 
                 # 创建封面项目
                 cover_img = epub.EpubItem(
@@ -81,9 +336,7 @@ def txt_to_epub(
 
                 print(f"已添加封面图片: {cover_image}")
             else:
-                print(
-                    f"警告: 封面图片格式不支持 ({img_type})。支持的格式: jpeg, png, gif"
-                )
+                print("警告: 封面图片格式不支持。支持的格式: jpeg, png, gif")
         except Exception as e:
             print(f"添加封面图片时出错: {e}")
     elif cover_image:
@@ -120,235 +373,127 @@ def txt_to_epub(
     )
     book.add_item(css_file)
 
-    # 读取TXT文件内容
-    try:
-        with open(txt_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        try:
-            # 尝试使用GBK编码读取
-            with open(txt_path, "r", encoding="gbk") as f:
-                content = f.read()
-        except Exception as e:
-            print(f"无法读取文件: {e}")
-            sys.exit(1)
-
-    # 按行分割内容
-    lines = content.split("\n")
-
     # 识别章节
-    chapter_regex = re.compile(chapter_pattern)
-    chapters = []
-    current_title = "前言"
-
-    # 检查是否有缩进的函数，用于识别新段落
-    def has_indent(line):
-        """检查行是否以全角空格或多个空格开头（表示有缩进）"""
-        if not line:
-            return False
-        # 检测全角空格（常用于中文排版）
-        if line.startswith("　"):
-            return True
-        # 检测普通空格缩进（至少两个空格）
-        if line.startswith("  ") or line.startswith("\t"):
-            return True
-        return False
-
-    # 删除行首缩进
-    def remove_indent(line):
-        """删除行首的缩进空格，返回清理后的文本"""
-        if not line:
-            return ""
-        # 删除全角空格
-        line = line.lstrip("　")
-        # 删除普通空格和制表符
-        line = line.lstrip(" \t")
-        return line
-
-    # 处理段落格式的函数
-    def process_paragraphs(text_lines, mode, add_indent=False):
-        """根据指定模式处理段落"""
-        paragraphs = []
-
-        # 添加段落开头的缩进空格（如果启用）
-        indent_str = "　　" if add_indent else ""  # 使用全角空格作为缩进
-
-        if mode == "line":
-            # 每行作为一个段落，但尊重原始缩进
-            for line in text_lines:
-                original_line = line
-                line = line.strip()
-                if not line:
-                    continue
-
-                # 如果原始行有缩进，表示这是一个新段落
-                if has_indent(original_line):
-                    # 保留段落格式但确保统一缩进
-                    clean_text = remove_indent(original_line).strip()
-                    paragraphs.append(f"<p>{indent_str}{clean_text}</p>")
-                else:
-                    # 没有缩进的行
-                    paragraphs.append(f"<p>{indent_str}{line}</p>")
-
-        elif mode == "blank":
-            # 空行分隔段落
-            current_para = []
-            for line in text_lines:
-                stripped_line = line.strip()
-
-                # 如果是空行，则结束当前段落
-                if not stripped_line:
-                    if current_para:
-                        paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-                        current_para = []
-                    continue
-
-                # 检查是否有缩进（新段落的标志）
-                if has_indent(line) and current_para:
-                    # 结束前一个段落
-                    paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-                    current_para = []
-                    # 开始新段落，移除缩进
-                    current_para.append(remove_indent(line).strip())
-                else:
-                    # 正常添加到当前段落
-                    if has_indent(line):
-                        # 如果有缩进但是段落的第一行，移除缩进
-                        current_para.append(remove_indent(line).strip())
-                    else:
-                        current_para.append(stripped_line)
-
-            # 处理最后一个段落
-            if current_para:
-                paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-
-        elif mode == "smart":
-            # 智能识别：分析文本判断段落特征
-            # 首先检查是否有明显的缩进格式
-            has_indented_lines = any(
-                has_indent(line) for line in text_lines if line.strip()
-            )
-            has_blank_lines = any(not line.strip() for line in text_lines)
-
-            if has_indented_lines:
-                # 文本使用缩进表示段落，每个带缩进的行是新段落的开始
-                current_para = []
-                for line in text_lines:
-                    stripped_line = line.strip()
-                    if not stripped_line:
-                        # 跳过空行，但如果有未完成的段落则结束它
-                        if current_para:
-                            paragraphs.append(
-                                f"<p>{indent_str}{''.join(current_para)}</p>"
-                            )
-                            current_para = []
-                        continue
-
-                    if has_indent(line):
-                        # 有缩进，表示新段落开始
-                        if current_para:
-                            # 如果有未完成的段落，先结束它
-                            paragraphs.append(
-                                f"<p>{indent_str}{''.join(current_para)}</p>"
-                            )
-                            current_para = []
-                        # 开始新段落，移除缩进
-                        current_para.append(remove_indent(line).strip())
-                    else:
-                        # 没有缩进，继续当前段落
-                        current_para.append(stripped_line)
-
-                # 处理最后一个段落
-                if current_para:
-                    paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-
-            elif has_blank_lines:
-                # 使用空行作为段落分隔符
-                return process_paragraphs(text_lines, "blank", add_indent)
+    if chapter_pattern == _DEFAULT_CHAPTER_PATTERN:
+        chapter_regex = _DEFAULT_CHAPTER_RE
+        # 默认规则下章节标题必以"第"开头，先做前缀检查可跳过绝大多数正文行的正则匹配
+        chapter_prefix = "第"
+    else:
+        chapter_regex = re.compile(chapter_pattern)
+        chapter_prefix = ""
+
+    # 逐行扫描文件，按章节切分，同时完成每行的清理和缩进识别
+    def split_chapters(lines):
+        """流式读取行，逐章生成 (章节标题, 清理后的行列表, 缩进标记列表)"""
+        current_title = "前言"
+        chapter_lines = []
+        chapter_indents = []
+
+        # 循环中用到的方法预先绑定到局部变量，省去每行的属性查找
+        match_chapter = chapter_regex.match
+        escape = html.escape
+        add_line = chapter_lines.append
+        add_indent_flag = chapter_indents.append
+
+        for line in lines:
+            # 不对原始行进行修改，保留行首空白以便识别缩进
+            stripped_line = line.strip()
+            if not stripped_line:
+                # 保留空行，用于段落识别
+                add_line("")
+                add_indent_flag(False)
+                continue
+
+            # 检查是否是新章节开始
+            if stripped_line.startswith(chapter_prefix) and match_chapter(
+                stripped_line
+            ):
+                # 交出之前收集的章节内容
+                if chapter_lines:
+                    yield current_title, chapter_lines, chapter_indents
+
+                # 开始新章节
+                current_title = stripped_line
+                chapter_lines = []
+                chapter_indents = []
+                add_line = chapter_lines.append
+                add_indent_flag = chapter_indents.append
             else:
-                # 没有明显段落标记，基于标点符号和行特征智能识别
-                current_para = []
-                for line in text_lines:
-                    line = line.strip()
-                    if not line:
-                        continue
+                # 转义HTML特殊字符以便直接输出XHTML
+                add_line(escape(stripped_line, quote=False))
+                add_indent_flag(_has_indent(line))
 
-                    # 判断一行是否可能是段落的结束
-                    is_end_of_para = False
-                    if line and line[-1] in "。！？.!?\"'」》)）":
-                        is_end_of_para = True
+        # 交出最后一个章节
+        if chapter_lines:
+            yield current_title, chapter_lines, chapter_indents
 
-                    current_para.append(line)
-
-                    if is_end_of_para:
-                        paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-                        current_para = []
-
-                # 处理最后一个段落
-                if current_para:
-                    paragraphs.append(f"<p>{indent_str}{''.join(current_para)}</p>")
-
-        return paragraphs
-
-    # 处理章节和段落
-    chapter_lines = []
+    # 读取TXT文件内容，直接迭代文件对象，不再额外生成整本书的字符串副本
+    encoding = _detect_encoding(txt_path)
+    escaped_language = html.escape(language)
+    chapter_items = []
+    with open(
+        txt_path,
+        "r",
+        encoding=encoding,
+        errors="replace",
+        buffering=_READ_BUFFER_SIZE,
+    ) as f:
+        raw_chapters = split_chapters(f)
+
+        # 选择段落处理函数（每本书只选择一次）
+        if paragraph_mode == "smart":
+            process_paragraphs, raw_chapters = _detect_smart_processor(raw_chapters)
+        else:
+            process_paragraphs = _PARAGRAPH_PROCESSORS[paragraph_mode]
+
+        # 各章节的段落处理互不依赖，指定多个进程时并行处理
+        if max_workers > 1:
+            # 多进程需要先收集全部章节再分发
+            raw_chapters = list(raw_chapters)
+        if max_workers > 1 and len(raw_chapters) > 1:
+            # 按批次分发章节，减少进程间通信次数
+            chunksize = max(1, len(raw_chapters) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        process_paragraphs,
+                        [lines for _, lines, _ in raw_chapters],
+                        [indents for _, _, indents in raw_chapters],
+                        repeat(force_indent),
+                        chunksize=chunksize,
+                    )
+                )
+            chapters = zip((title for title, _, _ in raw_chapters), results)
+        else:
+            # 逐章处理，处理完的章节原始行随即释放
+            chapters = (
+                (chapter_title, process_paragraphs(lines, indents, force_indent))
+                for chapter_title, lines, indents in raw_chapters
+            )
 
-    for line in lines:
-        # 不对行进行strip，保留原始格式以便识别缩进
-        if not line.strip():
-            chapter_lines.append("")  # 保留空行，用于段落识别
-            continue
+        # 创建章节文件
+        for chapter_title, chapter_content in chapters:
+            if not chapter_content:
+                continue
 
-        # 检查是否是新章节开始
-        match = chapter_regex.match(line.strip())
-        if match:
-            # 处理之前收集的章节内容
-            if chapter_lines:
-                chapter_content = process_paragraphs(
-                    chapter_lines, paragraph_mode, force_indent
-                )
-                if chapter_content:
-                    chapters.append((current_title, "\n".join(chapter_content)))
+            i = len(chapter_items)
+            chapter_id = f"chapter_{i+1}"
+            chapter_file_name = f"chapter_{i+1}.xhtml"
 
-            # 开始新章节
-            current_title = line.strip()
-            chapter_lines = []
-        else:
-            chapter_lines.append(line)  # 保留原始行（包括空格）
+            chapter = _XhtmlChapter(
+                title=chapter_title, file_name=chapter_file_name, lang=language
+            )
 
-    # 处理最后一个章节
-    if chapter_lines:
-        chapter_content = process_paragraphs(
-            chapter_lines, paragraph_mode, force_indent
-        )
-        if chapter_content:
-            chapters.append((current_title, "\n".join(chapter_content)))
+            # 章节内容全部由本程序生成，直接输出完整的XHTML文档
+            chapter_html = _CHAPTER_TEMPLATE(
+                lang=escaped_language,
+                title=html.escape(chapter_title),
+                content="".join(chapter_content),
+            )
+            chapter.content = chapter_html.encode("utf-8")
 
-    # 创建章节文件
-    chapter_items = []
-    for i, (chapter_title, chapter_content) in enumerate(chapters):
-        chapter_id = f"chapter_{i+1}"
-        chapter_file_name = f"chapter_{i+1}.xhtml"
-
-        chapter = epub.EpubHtml(
-            title=chapter_title, file_name=chapter_file_name, lang=language
-        )
-
-        chapter.content = f"""
-        <html>
-        <head>
-            <title>{chapter_title}</title>
-            <link rel="stylesheet" href="style/default.css" type="text/css" />
-        </head>
-        <body>
-            <h2>{chapter_title}</h2>
-            {chapter_content}
-        </body>
-        </html>
-        """
-
-        book.add_item(chapter)
-        chapter_items.append(chapter)
+            book.add_item(chapter)
+            chapter_items.append(chapter)
 
     # 添加所有章节到主要索引
     book.toc = chapter_items
@@ -362,11 +507,19 @@ def txt_to_epub(
     book.spine = spine
 
     # 创建EPUB文件
-    epub.write_epub(epub_path, book)
+    _write_epub(epub_path, book)
     print(f"转换完成: {epub_path}")
     return epub_path
 
 
+def _positive_int(value):
+    """argparse 参数类型：正整数"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"必须为正整数: {value}")
+    return number
+
+
 def main():
     # 创建命令行参数解析器
     parser = argparse.ArgumentParser(description="将TXT文件转换为EPUB电子书")
@@ -376,7 +529,10 @@ def main():
     parser.add_argument("-a", "--author", default="净无痕", help="作者名")
     parser.add_argument("-l", "--language", default="zh-CN", help="语言代码")
     parser.add_argument(
-        "-c", "--chapter-pattern", default=r"^第.+章.*$", help="章节识别的正则表达式"
+        "-c",
+        "--chapter-pattern",
+        default=_DEFAULT_CHAPTER_PATTERN,
+        help="章节识别的正则表达式",
     )
     parser.add_argument(
         "-i", "--cover-image", help="封面图片路径（支持JPG、PNG、GIF格式）"
@@ -394,6 +550,14 @@ def main():
         dest="force_indent",
         help="禁用强制段落缩进（默认启用）",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        dest="max_workers",
+        help="并行处理章节的进程数（默认为1，即不使用多进程）",
+    )
 
     args = parser.parse_args()
 
@@ -408,6 +572,7 @@ def main():
         args.cover_image,
         args.paragraph_mode,
         args.force_indent,
+        args.max_workers,
     )
 
 